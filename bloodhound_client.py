@@ -1,18 +1,106 @@
 import requests
+from requests.adapters import HTTPAdapter
 import hmac
 import hashlib
 import base64
 import datetime
 import json
+import re
 import yaml
 import os
 import argparse
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import math
+import threading
 import time
 from typing import Optional, Dict, Any, List, Union
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # httpx is optional; only needed for HTTP/2
+    httpx = None
+
+# Errors raised by raise_for_status() for either HTTP backend
+_HTTP_ERRORS = (requests.exceptions.HTTPError,) + ((httpx.HTTPStatusError,) if httpx is not None else ())
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Upper bound on cached intermediate signing keys
+_SIGNING_CACHE_SIZE = 256
+
+# Retries for a request answered with 429 Too Many Requests
+_MAX_RATE_LIMIT_RETRIES = 3
+
+# Consecutive successful requests before the request rate is raised again
+_RATE_INCREASE_AFTER = 10
+
+# Backoff never drops below the nominal rate divided by this; recovery adds this fraction back
+_RATE_BACKOFF_STEPS = 8
+
+# Nominal rate (requests/second) used for backoff when no rate limit is configured
+_UNLIMITED_BACKOFF_RATE = 20.0
+
+# Parallel downloads when fetching query files from a GitHub directory
+_GITHUB_FETCH_WORKERS = 8
+
+# File extensions recognised as query files
+_QUERY_FILE_EXTENSIONS = ('.json', '.yaml', '.yml', '.txt', '.cypher')
+
+# GitHub web URLs for a file (blob) and for a repository
+_GITHUB_BLOB_RE = re.compile(r'^https?://github\.com/([^/]+/[^/]+)/blob/(.+)$')
+_GITHUB_REPO_RE = re.compile(r'^https?://github\.com/([^/]+/[^/]+?)(?:\.git)?/?$')
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serialize obj to JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _json_loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _github_to_raw(url: str) -> str:
+    """
+    Convert a GitHub blob URL to its raw.githubusercontent.com URL; other URLs are returned unchanged.
+    """
+    if 'github.com' not in url:
+        return url
+    match = _GITHUB_BLOB_RE.match(url)
+    return f'https://raw.githubusercontent.com/{match.group(1)}/{match.group(2)}' if match else url
+
+def _fetch_text(url: str) -> str:
+    """
+    Download a text file (e.g., a query file hosted on GitHub).
+    """
+    response = requests.get(url)
+    response.raise_for_status()
+    return response.text
+
+def _query_hash(query_name: str, query: str) -> str:
+    """
+    Hash a query's name and Cypher text to recognise it on later runs.
+    """
+    return hashlib.sha256(f'{query_name}\0{query}'.encode()).hexdigest()
+
 class BloodHoundClient:
-    def __init__(self, base_url: str, token_id: str, token_key: str, rate_limit_delay: float = 0.5):
+    def __init__(self, base_url: str, token_id: str, token_key: str, rate_limit_delay: float = 0.5,
+                 burst: int = 1, force: bool = False, http2: bool = False, max_workers: int = 8,
+                 batch_size: int = 1):
         """
         Initialize the BloodHound API client.
         
@@ -20,56 +108,233 @@ class BloodHoundClient:
             base_url: The base URL of your BloodHound instance (e.g., 'http://localhost:8080')
             token_id: Your BloodHound API token ID
             token_key: Your BloodHound API token key
-            rate_limit_delay: Delay between requests in seconds (default: 0.5)
+            rate_limit_delay: Steady-state delay between requests in seconds (default: 0.5)
+            burst: Number of requests that may be sent back-to-back before the delay applies (default: 1)
+            force: Re-import queries already recorded as imported with this token (default: False)
+            http2: Talk to BloodHound over HTTP/2 with httpx, if installed (default: False)
+            max_workers: Queries imported in parallel when they are sent one at a time (default: 8)
+            batch_size: Queries per request; only raise this if the server accepts a JSON array
+                of saved queries (default: 1, no batching)
         """
         self.base_url = base_url.rstrip('/')
         self._credentials = type('Credentials', (), {'token_id': token_id, 'token_key': token_key})()
+        self._token_key_bytes = token_key.encode()
+        self._op_cache: Dict[tuple, bytes] = {}
+        self._date_cache: Dict[tuple, bytes] = {}
+        # (UTC hour bucket, encoded hour stage) of the signature, replaced as one tuple
+        # so concurrent requests never pair a new bucket with a stale hour
+        self._hour_cache = (-1, b'')
+        # Whether the server accepts a list of queries in one POST (None = unknown)
+        self._bulk_supported: Optional[bool] = None
         self.rate_limit_delay = rate_limit_delay
-        self.last_request_time = 0
+
+        # Token bucket rate limiter; the refill rate backs off on 429 and recovers on success
+        self._capacity = max(1, burst)
+        self._max_refill_rate = 1 / rate_limit_delay if rate_limit_delay > 0 else math.inf
+        self._refill_rate = self._max_refill_rate
+        # Finite rate to back off from (and recover to) after 429s, even when unlimited
+        self._nominal_rate = _UNLIMITED_BACKOFF_RATE if math.isinf(self._max_refill_rate) else self._max_refill_rate
+        self._min_refill_rate = self._nominal_rate / _RATE_BACKOFF_STEPS
+        self._tokens = float(self._capacity)
+        # Monotonic so wall-clock adjustments (e.g. NTP) cannot distort the refill
+        self._clock = time.monotonic
+        self._last_refill = self._clock()
+        self._success_streak = 0
+        # When the rate was last cut, so a burst of 429s from parallel workers only cuts it once
+        self._last_backoff = -math.inf
+        # Guards the limiter state so worker threads reserve request slots one at a time
+        self._rate_lock = threading.Lock()
+        self._max_workers = max(1, max_workers)
+        self._batch_size = max(1, batch_size)
+
+        # Hashes of queries already imported with this token into this instance, persisted between
+        # runs; saved queries belong to the user who created them, so the token is part of the key
+        self._force = force
+        cache_key = f'{self.base_url}\0{token_id}'.encode()
+        cache_name = f'{hashlib.sha1(cache_key).hexdigest()}.json'
+        self._cache_path = Path.home() / '.cache' / 'bloodhound_client' / cache_name
+        self._imported = self._load_imported()
+        self._imported_changed = False
+
+        # Reuse one session so bulk imports keep the connection alive
+        headers = {
+            'User-Agent': 'bloodhound-python-client',
+            'Content-Type': 'application/json',
+        }
+        self._session = None
+        if http2:
+            if httpx is None:
+                print("httpx is not installed, falling back to HTTP/1.1")
+            else:
+                try:
+                    self._session = httpx.Client(http2=True, headers=headers, timeout=30)
+                except ImportError:
+                    print("HTTP/2 support requires 'httpx[http2]', falling back to HTTP/1.1")
+        self._use_httpx = self._session is not None
+        if not self._use_httpx:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+            self._session.headers.update(headers)
+
+    def close(self) -> None:
+        """
+        Save the imported-query cache and close the underlying HTTP session.
+        """
+        self._save_imported()
+        self._session.close()
+
+    def _load_imported(self) -> set:
+        """
+        Load the hashes of previously imported queries from the cache file.
+        """
+        try:
+            return set(_json_loads(self._cache_path.read_bytes()))
+        except (OSError, ValueError, TypeError):
+            return set()
+
+    def _save_imported(self) -> None:
+        """
+        Write the hashes of imported queries back to the cache file if they changed.
+        """
+        if not self._imported_changed:
+            return
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache_path.write_bytes(_json_dumps(sorted(self._imported)))
+            self._imported_changed = False
+        except OSError as e:
+            print(f"Could not save imported query cache to {self._cache_path}: {e}")
+
+    def _mark_imported(self, query_hash: str) -> None:
+        """
+        Record a query hash (see _query_hash) as imported so later runs can skip it.
+        """
+        self._imported.add(query_hash)
+        self._imported_changed = True
+
+    def __enter__(self) -> 'BloodHoundClient':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _acquire_token(self) -> None:
+        """
+        Block until the token bucket allows another request, then consume a token.
+        """
+        with self._rate_lock:
+            if math.isinf(self._refill_rate):
+                return
+
+            now = self._clock()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate)
+            self._last_refill = now
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self._refill_rate
+                time.sleep(wait)
+                self._tokens = 1.0
+                self._last_refill = now + wait
+            self._tokens -= 1
+
+    def _rate_limited(self, response: requests.Response) -> float:
+        """
+        Halve the request rate after a 429 (never below the floor, and at most once per
+        refill period) and return how long to wait before retrying.
+        """
+        with self._rate_lock:
+            self._success_streak = 0
+            now = self._clock()
+            rate = min(self._refill_rate, self._nominal_rate)
+            if now - self._last_backoff >= 1 / rate:
+                self._refill_rate = max(self._min_refill_rate, rate * 0.5)
+                self._last_backoff = now
+            try:
+                return max(0.0, float(response.headers.get('Retry-After', '1')))
+            except ValueError:
+                # Retry-After given as an HTTP date
+                return 1 / self._refill_rate
+
+    def _request_succeeded(self) -> None:
+        """
+        Restore the request rate additively after a run of successful (2xx) requests.
+        """
+        with self._rate_lock:
+            if self._refill_rate >= self._max_refill_rate:
+                return
+            self._success_streak += 1
+            if self._success_streak >= _RATE_INCREASE_AFTER:
+                self._success_streak = 0
+                self._refill_rate += self._nominal_rate / _RATE_BACKOFF_STEPS
+                if self._refill_rate >= self._nominal_rate:
+                    # Fully recovered; for an unlimited client this lifts the limit again
+                    self._refill_rate = self._max_refill_rate
 
     def _request(self, method: str, uri: str, body: Optional[bytes] = None) -> requests.Response:
         """
         Make an authenticated request to the BloodHound API with rate limiting.
+        Requests answered with 429 are retried after the server's Retry-After delay.
         """
-        # Implement rate limiting
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last_request)
-        
-        # Initialize HMAC-SHA-256 digester
-        digester = hmac.new(self._credentials.token_key.encode(), None, hashlib.sha256)
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            self._acquire_token()
+            response = self._send(method, uri, body)
+            if response.status_code != 429:
+                if 200 <= response.status_code < 300:
+                    self._request_succeeded()
+                break
+            if attempt < _MAX_RATE_LIMIT_RETRIES:
+                wait = self._rate_limited(response)
+                print(f"Rate limit hit, waiting {wait} seconds...")
+                time.sleep(wait)
+
+        return response
 
-        # Create operation key (method + URI)
-        digester.update(f'{method}{uri}'.encode())
-        digester = hmac.new(digester.digest(), None, hashlib.sha256)
+    def _send(self, method: str, uri: str, body: Optional[bytes] = None) -> requests.Response:
+        """
+        Sign and send a single request to the BloodHound API.
+        """
+        # Create operation key (method + URI), which never changes per endpoint
+        operation_key = self._op_cache.get((method, uri))
+        if operation_key is None:
+            operation_key = hmac.digest(self._token_key_bytes, f'{method}{uri}'.encode(), 'sha256')
+            if len(self._op_cache) >= _SIGNING_CACHE_SIZE:
+                self._op_cache.clear()
+            self._op_cache[(method, uri)] = operation_key
 
-        # Add date key (RFC3339 datetime truncated to hour)
-        datetime_formatted = datetime.datetime.now().astimezone().isoformat('T')
-        digester.update(datetime_formatted[:13].encode())
-        digester = hmac.new(digester.digest(), None, hashlib.sha256)
+        # Add date key (RFC3339 datetime truncated to hour), reused within the hour.
+        # Uses wall-clock time, as the server checks RequestDate against its own clock;
+        # UTC keeps hour boundaries aligned with the timestamp, whatever the local offset.
+        now = int(time.time())
+        datetime_formatted = datetime.datetime.fromtimestamp(now, datetime.timezone.utc).isoformat('T')
+        bucket, hour = self._hour_cache
+        if bucket != now // 3600:
+            hour = datetime_formatted[:13].encode()
+            self._hour_cache = (now // 3600, hour)
+        date_key = self._date_cache.get((operation_key, hour))
+        if date_key is None:
+            date_key = hmac.digest(operation_key, hour, 'sha256')
+            if len(self._date_cache) >= _SIGNING_CACHE_SIZE:
+                self._date_cache.clear()
+            self._date_cache[(operation_key, hour)] = date_key
 
-        # Add body if present
-        if body is not None:
-            digester.update(body)
+        # Sign the body (empty if not present)
+        signature = hmac.digest(date_key, body or b'', 'sha256')
 
         # Make the request with authentication headers
-        response = requests.request(
+        # httpx takes raw bytes as content=, requests as data=
+        body_arg = 'content' if self._use_httpx else 'data'
+        response = self._session.request(
             method=method,
             url=f"{self.base_url}{uri}",
             headers={
-                'User-Agent': 'bloodhound-python-client',
                 'Authorization': f'bhesignature {self._credentials.token_id}',
                 'RequestDate': datetime_formatted,
-                'Signature': base64.b64encode(digester.digest()).decode(),
-                'Content-Type': 'application/json',
+                'Signature': base64.b64encode(signature).decode(),
             },
-            data=body,
+            **{body_arg: body},
         )
-        
-        # Update last request time
-        self.last_request_time = time.time()
-        
+
         return response
 
     def import_custom_query(self, query_name: str, query: str, description: str = "") -> Dict[str, Any]:
@@ -82,8 +347,13 @@ class BloodHoundClient:
             description: Optional description of the query
             
         Returns:
-            Dict containing the API response
+            Dict containing the API response, or {'skipped': True} if the query was
+            already imported on a previous run
         """
+        query_hash = _query_hash(query_name, query)
+        if not self._force and query_hash in self._imported:
+            return {'skipped': True}
+
         # BloodHound CE uses /api/v2/saved-queries endpoint
         uri = '/api/v2/saved-queries'
         body = {
@@ -92,23 +362,181 @@ class BloodHoundClient:
             'description': description
         }
         
+        # Encode once; _request reuses the same bytes if it has to retry
+        encoded = _json_dumps(body)
         try:
-            response = self._request('POST', uri, body=json.dumps(body).encode())
+            response = self._request('POST', uri, body=encoded)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429:  # Too Many Requests
-                print(f"Rate limit hit, waiting {self.rate_limit_delay * 2} seconds...")
-                time.sleep(self.rate_limit_delay * 2)  # Double the delay when we hit the limit
-                # Retry the request
-                response = self._request('POST', uri, body=json.dumps(body).encode())
-                response.raise_for_status()
-                return response.json()
+            self._mark_imported(query_hash)
+            return _json_loads(response.content)
+        except _HTTP_ERRORS as e:
             print(f"Error details for query '{query_name}':")
             print(f"Status code: {e.response.status_code}")
             print(f"Response: {e.response.text}")
             raise
 
+    def import_custom_queries_bulk(self, queries: List[Dict[str, Any]], batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Import several custom Cypher queries, in parallel and optionally in batches.
+        
+        Batching is opt-in, as stock BloodHound CE only accepts one saved query per
+        request. With a batch size above 1, each batch is POSTed as a JSON array; if the
+        server rejects a batch, its queries are imported one at a time instead, and a
+        4xx disables batching for the rest of the session if it never succeeded.
+        
+        Args:
+            queries: List of dicts with 'name', 'query' and 'description' keys
+            batch_size: Maximum number of queries per request (default: the client's batch_size)
+            
+        Returns:
+            List of results from importing queries
+        """
+        uri = '/api/v2/saved-queries'
+        results = []
+        if batch_size is None:
+            batch_size = self._batch_size
+
+        # Hash each query once, for both the skip check and recording the import
+        hashed = [(query, _query_hash(query['name'], query['query'])) for query in queries]
+        if not self._force:
+            new_queries = [(query, query_hash) for query, query_hash in hashed if query_hash not in self._imported]
+            if len(new_queries) < len(hashed):
+                print(f"Skipping {len(hashed) - len(new_queries)} previously imported queries (use --force to re-import)")
+            hashed = new_queries
+        pending = iter(hashed)
+
+        # Queries to send one request each
+        single = []
+        while True:
+            hashed_chunk = list(itertools.islice(pending, max(1, batch_size)))
+            if not hashed_chunk:
+                break
+            chunk = [query for query, _ in hashed_chunk]
+
+            if len(chunk) > 1 and self._bulk_supported is not False:
+                response = self._request('POST', uri, body=_json_dumps(chunk))
+                if response.status_code < 400:
+                    self._bulk_supported = True
+                    for _, query_hash in hashed_chunk:
+                        self._mark_imported(query_hash)
+                    data = _json_loads(response.content)
+                    # Keep one result per query so import summaries stay accurate
+                    results.extend(data if isinstance(data, list) else [data] * len(chunk))
+                    for query in chunk:
+                        print(f"Imported query: {query['name']}")
+                    continue
+                if response.status_code < 500 and response.status_code != 429 and not self._bulk_supported:
+                    self._bulk_supported = False
+
+            single.extend(chunk)
+
+        if single:
+            # One request per query, in parallel; the rate limiter paces the workers
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                futures = {
+                    executor.submit(self.import_custom_query, query['name'], query['query'], query['description']): query
+                    for query in single
+                }
+                try:
+                    for future in as_completed(futures):
+                        query = futures[future]
+                        try:
+                            results.append(future.result())
+                            print(f"Imported query: {query['name']}")
+                        except Exception as e:
+                            print(f"Error importing query {query['name']}: {str(e)}")
+                except BaseException:
+                    # On Ctrl-C (or any other abort) drop the queued imports; only requests
+                    # already in flight finish before the exception propagates
+                    for future in futures:
+                        future.cancel()
+                    executor.shutdown(wait=False)
+                    raise
+
+        return results
+
+    def _normalize_queries(self, queries: Union[List[Dict[str, Any]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Turn parsed query definitions (a single query dict or a list of them) into import bodies.
+        
+        Args:
+            queries: Parsed query data with 'name', 'query' and 'description' keys
+            
+        Returns:
+            List of dicts ready for import_custom_queries_bulk
+            
+        Raises:
+            ValueError: If a list entry is not a query mapping
+        """
+        if isinstance(queries, dict):
+            queries = [queries]
+        elif not isinstance(queries, list):
+            return []
+
+        for index, query in enumerate(queries):
+            if not isinstance(query, dict):
+                raise ValueError(f"Query entry {index} is a {type(query).__name__}, expected a mapping")
+
+        return [
+            {
+                'name': query.get('name', 'Unnamed Query'),
+                'query': query.get('query', ''),
+                'description': query.get('description', '')
+            }
+            for query in queries
+        ]
+
+    def _parse_queries_from_text(self, content: str, file_name: str) -> List[Dict[str, Any]]:
+        """
+        Parse queries from the content of a JSON, YAML or plain text query file.
+        The format is chosen from the file extension; files without one are sniffed.
+        
+        Args:
+            content: Text content of the file
+            file_name: Name of the file, used to name plain text queries
+            
+        Returns:
+            List of dicts ready for import_custom_queries_bulk
+        """
+        suffix = Path(file_name).suffix.lower()
+        if suffix == '.json':
+            return self._normalize_queries(json.loads(content))
+        if suffix in ('.yaml', '.yml'):
+            return self._normalize_queries(yaml.load(content, Loader=_YAML_LOADER))
+
+        if not suffix:
+            # Unknown format: try JSON, then YAML, before treating it as plain text
+            try:
+                return self._normalize_queries(json.loads(content))
+            except json.JSONDecodeError:
+                pass
+            try:
+                queries = yaml.load(content, Loader=_YAML_LOADER)
+                if isinstance(queries, (list, dict)):
+                    return self._normalize_queries(queries)
+            except yaml.YAMLError:
+                pass
+
+        # Treat as plain text with a single query
+        return [{
+            'name': Path(file_name).stem,
+            'query': content.strip(),
+            'description': f"Query imported from {file_name}"
+        }]
+
+    def _import_queries_from_content(self, content: str, file_name: str) -> List[Dict[str, Any]]:
+        """
+        Import queries from the in-memory content of a query file.
+        
+        Args:
+            content: Text content of the file
+            file_name: Name of the file, used to name plain text queries
+            
+        Returns:
+            List of results from importing queries
+        """
+        return self.import_custom_queries_bulk(self._parse_queries_from_text(content, file_name))
+
     def import_queries_from_file(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Import queries from a local file.
@@ -120,63 +548,12 @@ class BloodHoundClient:
         Returns:
             List of results from importing queries
         """
-        results = []
         file_path = Path(file_path)
         
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Read file content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Try to parse as JSON first
-        try:
-            queries = json.loads(content)
-            if isinstance(queries, list):
-                for query in queries:
-                    result = self.import_custom_query(
-                        query.get('name', 'Unnamed Query'),
-                        query.get('query', ''),
-                        query.get('description', '')
-                    )
-                    results.append(result)
-            elif isinstance(queries, dict):
-                result = self.import_custom_query(
-                    queries.get('name', 'Unnamed Query'),
-                    queries.get('query', ''),
-                    queries.get('description', '')
-                )
-                results.append(result)
-        except json.JSONDecodeError:
-            # Try to parse as YAML
-            try:
-                queries = yaml.safe_load(content)
-                if isinstance(queries, list):
-                    for query in queries:
-                        result = self.import_custom_query(
-                            query.get('name', 'Unnamed Query'),
-                            query.get('query', ''),
-                            query.get('description', '')
-                        )
-                        results.append(result)
-                elif isinstance(queries, dict):
-                    result = self.import_custom_query(
-                        queries.get('name', 'Unnamed Query'),
-                        queries.get('query', ''),
-                        queries.get('description', '')
-                    )
-                    results.append(result)
-            except yaml.YAMLError:
-                # Treat as plain text with a single query
-                result = self.import_custom_query(
-                    file_path.stem,
-                    content.strip(),
-                    f"Query imported from {file_path.name}"
-                )
-                results.append(result)
-
-        return results
+        return self._import_queries_from_content(file_path.read_text(encoding='utf-8'), file_path.name)
 
     def import_queries_from_github(self, repo_url: str, branch: str = "main", path: str = "") -> List[Dict[str, Any]]:
         """
@@ -191,39 +568,34 @@ class BloodHoundClient:
             List of results from importing queries
         """
         # Convert GitHub URL to raw content URL
-        raw_url = repo_url.replace("github.com", "raw.githubusercontent.com")
-        if not raw_url.endswith("/"):
-            raw_url += "/"
-        raw_url += f"{branch}/{path}"
+        match = _GITHUB_REPO_RE.match(repo_url) if 'github.com' in repo_url else None
+        raw_url = f'https://raw.githubusercontent.com/{match.group(1)}' if match else repo_url.rstrip('/')
+        raw_url += f"/{branch}/{path}"
 
         # Get repository contents
         response = requests.get(raw_url)
         response.raise_for_status()
         
         results = []
-        if path.endswith(('.json', '.yaml', '.yml', '.txt', '.cypher')):
+        if path.endswith(_QUERY_FILE_EXTENSIONS):
             # Single file
-            result = self.import_queries_from_file(response.text)
-            results.extend(result)
+            results.extend(self._import_queries_from_content(response.text, Path(path).name))
         else:
-            # Directory listing
-            for item in response.json():
-                if item['type'] == 'file' and item['name'].endswith(('.json', '.yaml', '.yml', '.txt', '.cypher')):
-                    file_url = item['download_url']
-                    file_response = requests.get(file_url)
-                    file_response.raise_for_status()
-                    
-                    # Save to temporary file
-                    temp_file = Path(f"temp_{item['name']}")
-                    with open(temp_file, 'w', encoding='utf-8') as f:
-                        f.write(file_response.text)
-                    
-                    try:
-                        result = self.import_queries_from_file(str(temp_file))
-                        results.extend(result)
-                    finally:
-                        # Clean up temporary file
-                        temp_file.unlink()
+            # Directory listing: download all query files in parallel, then import them together
+            file_items = [
+                item for item in _json_loads(response.content)
+                if item['type'] == 'file' and item['name'].endswith(_QUERY_FILE_EXTENSIONS)
+            ]
+            with ThreadPoolExecutor(max_workers=_GITHUB_FETCH_WORKERS) as executor:
+                texts = list(executor.map(_fetch_text, [item['download_url'] for item in file_items]))
+
+            queries = []
+            for item, text in zip(file_items, texts):
+                try:
+                    queries.extend(self._parse_queries_from_text(text, item['name']))
+                except (ValueError, yaml.YAMLError) as e:
+                    print(f"Error parsing query file {item['name']}: {str(e)}")
+            results.extend(self.import_custom_queries_bulk(queries))
 
         return results
 
@@ -240,14 +612,14 @@ def import_queries_from_json_url(client: BloodHoundClient, json_url: str) -> Lis
     """
     try:
         # Convert GitHub blob URL to raw content URL if needed
-        if 'github.com' in json_url and '/blob/' in json_url:
-            json_url = json_url.replace('github.com', 'raw.githubusercontent.com').replace('/blob/', '/')
+        json_url = _github_to_raw(json_url)
         
         response = requests.get(json_url)
         response.raise_for_status()
-        queries_data = response.json()
+        queries_data = _json_loads(response.content)
         
-        results = []
+        # Keyed by (name, query) so duplicates across groups are only imported once
+        pending: Dict[tuple, str] = {}
         # Handle different JSON structures
         if 'queries' in queries_data:
             # Compass/ZephrFish format
@@ -257,29 +629,20 @@ def import_queries_from_json_url(client: BloodHoundClient, json_url: str) -> Lis
                     if query_item.get('final', False):
                         query_name = f"{query_group['name']} - {category}"
                         query = query_item.get('query', '')
-                        description = f"Category: {category}"
-                        
-                        try:
-                            result = client.import_custom_query(query_name, query, description)
-                            results.append(result)
-                            print(f"Imported query: {query_name}")
-                        except Exception as e:
-                            print(f"Error importing query {query_name}: {str(e)}")
+                        if query:
+                            pending.setdefault((query_name, query), f"Category: {category}")
         else:
             # Simple array format
             for query_item in queries_data:
                 query_name = query_item.get('name', 'Unnamed Query')
                 query = query_item.get('query', '')
-                description = query_item.get('description', '')
-                
-                try:
-                    result = client.import_custom_query(query_name, query, description)
-                    results.append(result)
-                    print(f"Imported query: {query_name}")
-                except Exception as e:
-                    print(f"Error importing query {query_name}: {str(e)}")
-        
-        return results
+                if query:
+                    pending.setdefault((query_name, query), query_item.get('description', ''))
+
+        return client.import_custom_queries_bulk([
+            {'name': query_name, 'query': query, 'description': description}
+            for (query_name, query), description in pending.items()
+        ])
     except Exception as e:
         print(f"Error fetching queries from URL: {e}")
         return []
@@ -304,40 +667,51 @@ def main():
                       help='Path within GitHub repository or local directory')
     parser.add_argument('--rate-limit', type=float, default=0.5,
                       help='Delay between requests in seconds (default: 0.5)')
+    parser.add_argument('--burst', type=int, default=1,
+                      help='Requests allowed back-to-back before the rate limit applies (default: 1)')
+    parser.add_argument('--force', action='store_true',
+                      help='Re-import queries that were already imported on a previous run')
+    parser.add_argument('--workers', type=int, default=8,
+                      help='Queries imported in parallel when sent one at a time (default: 8)')
+    parser.add_argument('--batch-size', type=int, default=1,
+                      help='Queries per request, for servers that accept a JSON array of saved queries (default: 1)')
+    parser.add_argument('--http2', action='store_true',
+                      help='Use HTTP/2 via httpx (requires: pip install "httpx[http2]")')
 
     args = parser.parse_args()
 
     # Initialize the client with rate limiting
-    client = BloodHoundClient(args.url, args.token_id, args.token_key, rate_limit_delay=args.rate_limit)
+    with BloodHoundClient(args.url, args.token_id, args.token_key, rate_limit_delay=args.rate_limit,
+                         burst=args.burst, force=args.force, http2=args.http2,
+                         max_workers=args.workers, batch_size=args.batch_size) as client:
+        results = []
 
-    results = []
+        # Import from JSON URL if specified
+        if args.json_url:
+            print(f"Importing queries from JSON URL: {args.json_url}")
+            results.extend(import_queries_from_json_url(client, args.json_url))
 
-    # Import from JSON URL if specified
-    if args.json_url:
-        print(f"Importing queries from JSON URL: {args.json_url}")
-        results.extend(import_queries_from_json_url(client, args.json_url))
+        # Import from GitHub if specified
+        if args.github:
+            print(f"Importing queries from GitHub repository: {args.github}")
+            try:
+                github_results = client.import_queries_from_github(
+                    args.github,
+                    branch=args.branch,
+                    path=args.path
+                )
+                results.extend(github_results)
+            except Exception as e:
+                print(f"Error importing from GitHub: {e}")
 
-    # Import from GitHub if specified
-    if args.github:
-        print(f"Importing queries from GitHub repository: {args.github}")
-        try:
-            github_results = client.import_queries_from_github(
-                args.github,
-                branch=args.branch,
-                path=args.path
-            )
-            results.extend(github_results)
-        except Exception as e:
-            print(f"Error importing from GitHub: {e}")
-
-    # Import from local file if specified
-    if args.file:
-        print(f"Importing queries from local file: {args.file}")
-        try:
-            file_results = client.import_queries_from_file(args.file)
-            results.extend(file_results)
-        except Exception as e:
-            print(f"Error importing from local file: {e}")
+        # Import from local file if specified
+        if args.file:
+            print(f"Importing queries from local file: {args.file}")
+            try:
+                file_results = client.import_queries_from_file(args.file)
+                results.extend(file_results)
+            except Exception as e:
+                print(f"Error importing from local file: {e}")
 
     # Print summary
     print(f"\nImport Summary:")